@@ -78,9 +78,10 @@ def start_trial(
     if sub.plan in ("trial", "pro"):
         raise HTTPException(400, "Trial already used or already a Pro subscriber.")
 
+    now = datetime.utcnow()
     sub.plan = "trial"
-    sub.trial_start = datetime.utcnow()
-    sub.expires_at = datetime.utcnow() + timedelta(days=TRIAL_DAYS)
+    sub.trial_start = now
+    sub.expires_at = now + timedelta(days=TRIAL_DAYS)
     db.commit()
     db.refresh(sub)
     logger.info(f"Trial started for token {x_user_token[:8]}... expires {sub.expires_at}")
@@ -102,9 +103,10 @@ def upgrade_to_pro(
 
     sub = get_or_create_subscription(x_user_token, db)
 
+    now = datetime.utcnow()
     sub.plan = "pro"
     # Extend from now or from existing expiry (for renewals)
-    base = max(datetime.utcnow(), sub.expires_at or datetime.utcnow())
+    base = max(now, sub.expires_at or now)
     sub.expires_at = base + timedelta(days=PRO_DURATION_DAYS)
     db.commit()
     db.refresh(sub)
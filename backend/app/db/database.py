@@ -7,7 +7,9 @@ from pathlib import Path
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATA_DIR}/afyaplate.db"
+DB_PATH = DATA_DIR / "afyaplate.db"
+
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
@@ -23,3 +25,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def db_mtime() -> float:
+    """
+    Last modification time of the SQLite file, for keying caches of table data.
+    Changes whenever the database is written, e.g. by rebuild_db_from_xlsx.py.
+    """
+    try:
+        return DB_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
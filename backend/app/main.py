@@ -7,6 +7,9 @@ from app.api.v1.api import api_router
 from app.core.config import settings
 from app.db.database import engine, Base
 import app.models.sql_models  # noqa: F401 — registers all models with Base
+from app.services.mpesa_service import mpesa_service
+from app.services.flutterwave_service import flutterwave_service
+from app.services.crypto_service import crypto_service
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,6 +22,9 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown event
     logger.info("Shutting down...")
+    await mpesa_service.aclose()
+    await flutterwave_service.aclose()
+    await crypto_service.aclose()
 
 
 
@@ -1,7 +1,9 @@
 # backend/app/services/algo_service.py
 import random
-from typing import List, Dict, Any, Optional
-from app.db.database import SessionLocal
+from types import MappingProxyType
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from app.db.database import SessionLocal, db_mtime
 from app.models.sql_models import SQLFood
 from app.schemas.planner import PlannerRequest, PlannerResponse, Meal, MealItem, DailySummary, MacroNutrients
 
@@ -29,6 +31,37 @@ SNACK_TEMPLATE = [
     ("snack", ["groundnut", "banana", "mango", "avocado", "sweet potato", "arrowroot", "cassava", "fruit", "biscuit", "mandazi"], (100, 400)),
 ]
 
+# Share of daily calories per meal, keyed by meal count.
+# 5 meals: breakfast, lunch, snack, snack, dinner — also used for any other count.
+CALORIE_SPLITS = MappingProxyType({
+    1: (1.0,),
+    2: (0.45, 0.55),
+    3: (0.25, 0.40, 0.35),
+    4: (0.25, 0.35, 0.10, 0.30),
+    5: (0.22, 0.30, 0.08, 0.08, 0.32),
+})
+
+
+@lru_cache(maxsize=1)
+def _load_foods(mtime: float) -> Tuple[SQLFood, ...]:
+    """
+    Every food with a non-zero energy value. Cached per database mtime; rows are
+    detached from the session and only read, so they are safe to share between requests.
+    """
+    with SessionLocal() as db:
+        foods = db.query(SQLFood).filter(SQLFood.energy_kcal > 0).all()
+        db.expunge_all()
+    return tuple(foods)
+
+
+def _all_foods() -> Tuple[SQLFood, ...]:
+    """Cached food rows, reloaded whenever the database file changes."""
+    foods = _load_foods(db_mtime())
+    if not foods:
+        # Don't hold on to an empty read; the table may be seeded later
+        _load_foods.cache_clear()
+    return foods
+
 
 class AlgoService:
     def __init__(self):
@@ -36,9 +69,7 @@ class AlgoService:
 
     def _load_all_foods(self, dietary_restrictions: str = "") -> List[SQLFood]:
         """Load all foods and apply dietary filtering."""
-        with SessionLocal() as db:
-            foods = db.query(SQLFood).filter(SQLFood.energy_kcal > 0).all()
-            db.expunge_all()
+        foods = list(_all_foods())
 
         forbidden_keywords = []
         if dietary_restrictions:
@@ -53,12 +84,17 @@ class AlgoService:
 
         return foods
 
-    def _find_foods_for_role(self, all_foods: List[SQLFood], keywords: List[str], limit: int = 3) -> List[SQLFood]:
-        """Find foods matching keywords for a specific meal role."""
-        matched = [f for f in all_foods if any(k in (f.display_name or "").lower() for k in keywords)]
+    def _find_foods_for_role(self, all_foods: List[SQLFood], search_names: List[str], keywords: List[str], limit: int = 3) -> List[SQLFood]:
+        """Find foods matching keywords for a specific meal role.
+
+        `search_names` holds the lowercased display name of each entry in `all_foods`
+        (same order), built once per plan so each role lookup doesn't re-lowercase every food.
+        """
+        matched = [f for f, name in zip(all_foods, search_names) if any(k in name for k in keywords)]
         if len(matched) < limit:
             # Supplement with random foods if not enough matches
-            remaining = [f for f in all_foods if f not in matched]
+            matched_ids = {f.id for f in matched}
+            remaining = [f for f in all_foods if f.id not in matched_ids]
             matched.extend(random.sample(remaining, min(limit - len(matched), len(remaining))))
         return random.sample(matched, min(limit, len(matched)))
 
@@ -89,6 +125,8 @@ class AlgoService:
         if not all_foods:
             raise ValueError("No foods available in the database. Please seed the database first.")
 
+        search_names = [(f.display_name or "").lower() for f in all_foods]
+
         meals_data = []
         # Distribute calories: breakfast ~25%, lunch ~35%, dinner ~30%, snacks ~10%
         cal_distribution = self._get_calorie_distribution(meals_count, target_cals)
@@ -111,7 +149,7 @@ class AlgoService:
 
             for role, keywords, portion_range in template:
                 # Find a food for this role that hasn't been used yet
-                candidates = self._find_foods_for_role(all_foods, keywords, limit=5)
+                candidates = self._find_foods_for_role(all_foods, search_names, keywords, limit=5)
                 candidates = [c for c in candidates if c.id not in used_foods] or candidates
 
                 if not candidates:
@@ -194,20 +232,5 @@ class AlgoService:
 
     def _get_calorie_distribution(self, meals_count: int, total_cals: int) -> List[int]:
         """Distribute calories across meals realistically."""
-        if meals_count == 1:
-            return [total_cals]
-        elif meals_count == 2:
-            return [int(total_cals * 0.45), int(total_cals * 0.55)]
-        elif meals_count == 3:
-            return [int(total_cals * 0.25), int(total_cals * 0.40), int(total_cals * 0.35)]
-        elif meals_count == 4:
-            return [int(total_cals * 0.25), int(total_cals * 0.35), int(total_cals * 0.10), int(total_cals * 0.30)]
-        else:
-            # 5 meals: breakfast, lunch, snack, snack, dinner
-            return [
-                int(total_cals * 0.22),
-                int(total_cals * 0.30),
-                int(total_cals * 0.08),
-                int(total_cals * 0.08),
-                int(total_cals * 0.32),
-            ]
+        splits = CALORIE_SPLITS.get(meals_count, CALORIE_SPLITS[5])
+        return [int(total_cals * share) for share in splits]
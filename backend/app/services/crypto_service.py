@@ -10,12 +10,14 @@ import hashlib
 import hmac
 import httpx
 
+from app.services.http_client import SharedHTTPClientMixin
+
 logger = logging.getLogger(__name__)
 
 COINBASE_BASE = "https://api.commerce.coinbase.com"
 
 
-class CryptoService:
+class CryptoService(SharedHTTPClientMixin):
     def __init__(self):
         self.api_key = os.getenv("COINBASE_COMMERCE_API_KEY", "")
         self.webhook_secret = os.getenv("COINBASE_COMMERCE_WEBHOOK_SECRET", "")
@@ -50,28 +52,28 @@ class CryptoService:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                resp = await client.post(
-                    f"{COINBASE_BASE}/charges",
-                    headers=headers,
-                    json=payload,
-                )
-                logger.info(f"Coinbase Commerce response: {resp.status_code}")
-                if resp.status_code not in (200, 201):
-                    logger.error(f"Coinbase Commerce error: {resp.text}")
-                    raise Exception(f"Coinbase Commerce returned HTTP {resp.status_code}")
-                data = resp.json()["data"]
-                return {
-                    "payment_url": data["hosted_url"],
-                    "charge_id": data["id"],
-                    "charge_code": data["code"],
-                }
-            except httpx.TimeoutException:
-                raise Exception("Coinbase Commerce request timed out.")
-            except Exception as e:
-                logger.error(f"Coinbase Commerce charge creation failed: {e}")
-                raise
+        client = self.client
+        try:
+            resp = await client.post(
+                f"{COINBASE_BASE}/charges",
+                headers=headers,
+                json=payload,
+            )
+            logger.info(f"Coinbase Commerce response: {resp.status_code}")
+            if resp.status_code not in (200, 201):
+                logger.error(f"Coinbase Commerce error: {resp.text}")
+                raise Exception(f"Coinbase Commerce returned HTTP {resp.status_code}")
+            data = resp.json()["data"]
+            return {
+                "payment_url": data["hosted_url"],
+                "charge_id": data["id"],
+                "charge_code": data["code"],
+            }
+        except httpx.TimeoutException:
+            raise Exception("Coinbase Commerce request timed out.")
+        except Exception as e:
+            logger.error(f"Coinbase Commerce charge creation failed: {e}")
+            raise
 
     def verify_webhook_signature(self, raw_body: bytes, signature: str) -> bool:
         """Verify Coinbase Commerce webhook HMAC-SHA256 signature."""
@@ -8,12 +8,14 @@ import os
 import logging
 import httpx
 
+from app.services.http_client import SharedHTTPClientMixin
+
 logger = logging.getLogger(__name__)
 
 FLW_BASE = "https://api.flutterwave.com/v3"
 
 
-class FlutterwaveService:
+class FlutterwaveService(SharedHTTPClientMixin):
     def __init__(self):
         self.secret_key = os.getenv("FLUTTERWAVE_SECRET_KEY", "")
         self.public_key = os.getenv("FLUTTERWAVE_PUBLIC_KEY", "")
@@ -55,36 +57,36 @@ class FlutterwaveService:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                resp = await client.post(f"{FLW_BASE}/payments", headers=headers, json=payload)
-                logger.info(f"Flutterwave response: {resp.status_code}")
-                if resp.status_code != 200:
-                    logger.error(f"Flutterwave error: {resp.text}")
-                    raise Exception(f"Flutterwave returned HTTP {resp.status_code}")
-                data = resp.json()
-                return {
-                    "payment_url": data["data"]["link"],
-                    "tx_ref": payload["tx_ref"],
-                }
-            except httpx.TimeoutException:
-                raise Exception("Flutterwave request timed out.")
-            except Exception as e:
-                logger.error(f"Flutterwave payment link creation failed: {e}")
-                raise
+        client = self.client
+        try:
+            resp = await client.post(f"{FLW_BASE}/payments", headers=headers, json=payload)
+            logger.info(f"Flutterwave response: {resp.status_code}")
+            if resp.status_code != 200:
+                logger.error(f"Flutterwave error: {resp.text}")
+                raise Exception(f"Flutterwave returned HTTP {resp.status_code}")
+            data = resp.json()
+            return {
+                "payment_url": data["data"]["link"],
+                "tx_ref": payload["tx_ref"],
+            }
+        except httpx.TimeoutException:
+            raise Exception("Flutterwave request timed out.")
+        except Exception as e:
+            logger.error(f"Flutterwave payment link creation failed: {e}")
+            raise
 
     async def verify_transaction(self, transaction_id: str) -> dict:
         """Verify a completed Flutterwave transaction by ID."""
         if not self.secret_key:
             raise Exception("FLUTTERWAVE_SECRET_KEY not configured.")
         headers = {"Authorization": f"Bearer {self.secret_key}"}
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{FLW_BASE}/transactions/{transaction_id}/verify",
-                headers=headers,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = self.client
+        resp = await client.get(
+            f"{FLW_BASE}/transactions/{transaction_id}/verify",
+            headers=headers,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
 
 flutterwave_service = FlutterwaveService()
@@ -0,0 +1,26 @@
+"""
+Shared outbound HTTP client for the payment services.
+"""
+from typing import Optional
+
+import httpx
+
+
+class SharedHTTPClientMixin:
+    """
+    Gives a service one lazily created httpx.AsyncClient, so consecutive calls reuse
+    a keep-alive connection pool instead of opening a new TLS session per request.
+    The app closes it on shutdown via aclose().
+    """
+    http_timeout: float = 15.0
+    _client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.http_timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
@@ -1,8 +1,7 @@
-import json
 import logging
-from google import genai
-from google.genai import types
-from litellm import acompletion
+import random
+from functools import lru_cache
+from pydantic import ValidationError
 from app.schemas.planner import PlannerRequest, PlannerResponse
 
 logging.basicConfig(level=logging.INFO)
@@ -56,19 +55,39 @@ You MUST respond with only a valid JSON object that strictly adheres to the sche
 5.  All macro values should be in grams.
 """
 
-async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
-    # 1. Fetch DB Context
+@lru_cache(maxsize=1)
+def _load_food_names(mtime: float) -> tuple:
+    """Names of every food in the database, cached per database mtime."""
     from app.db.database import SessionLocal
     from app.models.sql_models import SQLFood
-    import random
 
-    db_context_list = ""
     with SessionLocal() as db:
-        foods = db.query(SQLFood).all()
-        # Random sample so the LLM gets variety on different runs, up to 150 items
-        sampled_foods = random.sample(foods, min(150, len(foods)))
-        food_names = [f.food_name_english or f.food_name_swahili or f.display_name for f in sampled_foods if f]
-        db_context_list = ", ".join(filter(None, food_names))
+        rows = db.query(SQLFood.food_name_english, SQLFood.food_name_swahili, SQLFood.display_name).all()
+    return tuple(filter(None, (english or swahili or display for english, swahili, display in rows)))
+
+def _food_names() -> tuple:
+    """Cached food names, reloaded whenever the database file changes."""
+    from app.db.database import db_mtime
+
+    names = _load_food_names(db_mtime())
+    if not names:
+        # Don't hold on to an empty read; the table may be seeded later
+        _load_food_names.cache_clear()
+    return names
+
+@lru_cache(maxsize=1)
+def _server_gemini_client():
+    """Client for the server's GEMINI_API_KEY, reused so requests share its HTTP connection pool."""
+    from google import genai
+    from app.core.config import settings
+
+    return genai.Client(api_key=settings.GEMINI_API_KEY)
+
+async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
+    # 1. Fetch DB Context
+    food_names = _food_names()
+    # Random sample so the LLM gets variety on different runs, up to 150 items
+    db_context_list = ", ".join(random.sample(food_names, min(150, len(food_names))))
 
     user_prompt = f"""
     Please generate a meal plan with the following requirements:
@@ -89,11 +108,14 @@ async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
     # Use google-genai for Gemini
     if request.llm_provider.lower() == "gemini":
         try:
-            from app.core.config import settings
-            server_key = settings.GEMINI_API_KEY
-            api_key_to_use = request.llm_api_key if request.llm_api_key and request.llm_api_key != "********************" else server_key
+            from google import genai
+            from google.genai import types
             # Use the async client
-            client = genai.Client(api_key=api_key_to_use)
+            if request.llm_api_key and request.llm_api_key != "********************":
+                # User-supplied keys get a per-request client so they aren't kept in memory
+                client = genai.Client(api_key=request.llm_api_key)
+            else:
+                client = _server_gemini_client()
             model_id = request.llm_model if "gemini" in request.llm_model else "gemini-2.5-pro"
             
             response = await client.aio.models.generate_content(
@@ -105,8 +127,8 @@ async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
                 )
             )
             
-            plan_data = json.loads(response.text)
-            return PlannerResponse(**plan_data)
+            # Parse and validate in a single pass through pydantic-core
+            return PlannerResponse.model_validate_json(response.text)
             
         except Exception as e:
             logger.error(f"Google GenAI error: {e}")
@@ -117,6 +139,8 @@ async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
     litellm_model = f"{request.llm_provider}/{request.llm_model}"
 
     try:
+        # litellm is slow to import; only pay for it when a non-Gemini provider is used
+        from litellm import acompletion
         from app.core.config import settings
         keys = {
             "openai": settings.OPENAI_API_KEY,
@@ -139,12 +163,14 @@ async def generate_meal_plan(request: PlannerRequest) -> PlannerResponse:
         )
         
         content = response.choices[0].message.content
-        plan_data = json.loads(content)
-        return PlannerResponse(**plan_data)
+        return PlannerResponse.model_validate_json(content)
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON from LLM response: {content}")
-        raise ValueError("The AI model failed to return a valid JSON object.") from e
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            logger.error(f"Failed to decode JSON from LLM response: {content}")
+            raise ValueError("The AI model failed to return a valid JSON object.") from e
+        logger.error(f"LLM response did not match the meal plan schema: {e}")
+        raise
     except Exception as e:
         logger.error(f"LiteLLM completion error: {e}")
         raise
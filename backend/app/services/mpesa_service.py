@@ -5,9 +5,11 @@ import logging
 from datetime import datetime
 import httpx
 
+from app.services.http_client import SharedHTTPClientMixin
+
 logger = logging.getLogger(__name__)
 
-class MpesaService:
+class MpesaService(SharedHTTPClientMixin):
     def __init__(self):
         self.consumer_key = os.getenv("MPESA_CONSUMER_KEY", "0GUqGdwEpwWmVGMoMfN51LafFQQhXy7batFbTtvUlk2DKWo5")
         self.consumer_secret = os.getenv("MPESA_CONSUMER_SECRET", "8rPhSvk3Idjd5UdAE5ceZQ4iKraCIhRPIFN2d0JN14dt5wdO2U53QqjtvRWOnWH8")
@@ -24,30 +26,30 @@ class MpesaService:
             "Authorization": f"Basic {encoded_credentials}"
         }
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                response = await client.get(url, headers=headers)
-                logger.info(f"Access token response status: {response.status_code}")
-                if response.status_code != 200:
-                    logger.error(f"Access token HTTP {response.status_code}: {response.text[:500]}")
-                    raise Exception(f"Safaricom auth returned HTTP {response.status_code}. Check your consumer key/secret.")
-                # Guard against HTML error pages (e.g. Incapsula CDN block)
-                content_type = response.headers.get("content-type", "")
-                if "html" in content_type.lower():
-                    logger.error(f"Safaricom returned HTML instead of JSON (possible CDN block): {response.text[:300]}")
-                    raise Exception("Safaricom server returned an unexpected HTML response. The sandbox may be temporarily blocking requests from this IP. Try again shortly.")
-                data = response.json()
-                token = data.get("access_token")
-                if not token:
-                    logger.error(f"No access_token in response: {data}")
-                    raise Exception("No access_token returned from Safaricom.")
-                return token
-            except httpx.TimeoutException:
-                logger.error("Timed out connecting to Safaricom auth endpoint")
-                raise Exception("Connection to Safaricom timed out. Please try again.")
-            except Exception as e:
-                logger.error(f"Failed to get M-Pesa access token: {e}")
-                raise
+        client = self.client
+        try:
+            response = await client.get(url, headers=headers)
+            logger.info(f"Access token response status: {response.status_code}")
+            if response.status_code != 200:
+                logger.error(f"Access token HTTP {response.status_code}: {response.text[:500]}")
+                raise Exception(f"Safaricom auth returned HTTP {response.status_code}. Check your consumer key/secret.")
+            # Guard against HTML error pages (e.g. Incapsula CDN block)
+            content_type = response.headers.get("content-type", "")
+            if "html" in content_type.lower():
+                logger.error(f"Safaricom returned HTML instead of JSON (possible CDN block): {response.text[:300]}")
+                raise Exception("Safaricom server returned an unexpected HTML response. The sandbox may be temporarily blocking requests from this IP. Try again shortly.")
+            data = response.json()
+            token = data.get("access_token")
+            if not token:
+                logger.error(f"No access_token in response: {data}")
+                raise Exception("No access_token returned from Safaricom.")
+            return token
+        except httpx.TimeoutException:
+            logger.error("Timed out connecting to Safaricom auth endpoint")
+            raise Exception("Connection to Safaricom timed out. Please try again.")
+        except Exception as e:
+            logger.error(f"Failed to get M-Pesa access token: {e}")
+            raise
 
     async def trigger_stk_push(self, phone_number: str, amount: int) -> dict:
         """
@@ -90,30 +92,30 @@ class MpesaService:
             "TransactionDesc": "Meal Plan Premium"
         }
         
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        client = self.client
+        try:
+            response = await client.post(url, headers=headers, json=payload, timeout=20.0)
+            # Guard against Incapsula HTML block pages
+            content_type = response.headers.get("content-type", "")
+            if "html" in content_type.lower():
+                logger.error(f"Safaricom STK endpoint returned HTML (CDN block): {response.text[:300]}")
+                raise Exception("Safaricom returned an unexpected response (CDN block). Please try again in a moment.")
+            response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException:
+            logger.error("Timed out connecting to Safaricom STK endpoint")
+            raise Exception("Connection to Safaricom timed out. Please try again.")
+        except httpx.HTTPStatusError as e:
+            raw = e.response.text
+            logger.error(f"M-Pesa API Error: {raw}")
             try:
-                response = await client.post(url, headers=headers, json=payload)
-                # Guard against Incapsula HTML block pages
-                content_type = response.headers.get("content-type", "")
-                if "html" in content_type.lower():
-                    logger.error(f"Safaricom STK endpoint returned HTML (CDN block): {response.text[:300]}")
-                    raise Exception("Safaricom returned an unexpected response (CDN block). Please try again in a moment.")
-                response.raise_for_status()
-                return response.json()
-            except httpx.TimeoutException:
-                logger.error("Timed out connecting to Safaricom STK endpoint")
-                raise Exception("Connection to Safaricom timed out. Please try again.")
-            except httpx.HTTPStatusError as e:
-                raw = e.response.text
-                logger.error(f"M-Pesa API Error: {raw}")
-                try:
-                    error_data = e.response.json()
-                    msg = error_data.get('errorMessage') or error_data.get('ResultDesc') or str(e)
-                    raise Exception(f"M-Pesa Error: {msg}")
-                except (json.JSONDecodeError, ValueError):
-                    raise Exception(f"M-Pesa HTTP Error {e.response.status_code}: {raw[:200]}")
-            except Exception as e:
-                logger.error(f"Failed to trigger STK push: {e}")
-                raise
+                error_data = e.response.json()
+                msg = error_data.get('errorMessage') or error_data.get('ResultDesc') or str(e)
+                raise Exception(f"M-Pesa Error: {msg}")
+            except (json.JSONDecodeError, ValueError):
+                raise Exception(f"M-Pesa HTTP Error {e.response.status_code}: {raw[:200]}")
+        except Exception as e:
+            logger.error(f"Failed to trigger STK push: {e}")
+            raise
 
 mpesa_service = MpesaService()
@@ -1,25 +1,41 @@
 import os
+import json
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
 from io import BytesIO
 from app.schemas.planner import PlannerResponse
 
 # Setup Jinja2 environment
 template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
 env = Environment(loader=FileSystemLoader(template_dir))
+template = env.get_template("meal_plan.html")
 
-def generate_meal_plan_pdf(plan: PlannerResponse) -> BytesIO:
+@lru_cache(maxsize=1)
+def _font_config():
     """
-    Renders a PlannerResponse into a styled PDF using an HTML template.
+    Shared across renders so WeasyPrint doesn't rebuild its font map for every PDF.
+    WeasyPrint (and Pango behind it) is imported on first export rather than at startup.
     """
-    template = env.get_template("meal_plan.html")
-    
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+@lru_cache(maxsize=32)
+def _render_pdf(plan_json: str) -> bytes:
+    """
+    Renders a serialized plan to PDF bytes. Cached on the JSON so re-exporting
+    an unchanged plan skips the WeasyPrint layout pass.
+    """
+    from weasyprint import HTML
+
     # Render HTML with plan data
-    html_content = template.render(plan=plan.model_dump())
+    html_content = template.render(plan=json.loads(plan_json))
     
     # Convert HTML to PDF in memory
-    pdf_buffer = BytesIO()
-    HTML(string=html_content).write_pdf(pdf_buffer)
-    pdf_buffer.seek(0)
-    
-    return pdf_buffer
+    return HTML(string=html_content).write_pdf(font_config=_font_config())
+
+def generate_meal_plan_pdf(plan: PlannerResponse) -> BytesIO:
+    """
+    Renders a PlannerResponse into a styled PDF using an HTML template.
+    """
+    return BytesIO(_render_pdf(plan.model_dump_json()))
@@ -162,9 +162,10 @@ def rebuild_database(conn, merged):
     conn.commit()
 
     kfct_count = 0
-    foods_count = 0
+    foods_rows = []
 
-    for i, row in merged.iterrows():
+    # Plain dict records avoid iterrows' per-row Series construction
+    for i, row in enumerate(merged.to_dict("records")):
         food_name, code, prefix = code_assignments[i]
 
         kcal  = clean_float(row.get("energy_kcal"))
@@ -223,19 +224,25 @@ def rebuild_database(conn, merged):
         )
         kfct_count += 1
 
-        cur.execute(
-            """INSERT INTO foods
-               (food_code, food_name_english, food_name_swahili, category, display_name,
-                energy_kcal, protein_g, fat_g, carbs_g, fibre_g, calcium_mg, iron_mg, zinc_mg)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        foods_rows.append(
             (code, food_name, None, short_cat, food_name,
-             kcal, prot, fat, carbs, fibre, ca, fe, zn),
+             kcal, prot, fat, carbs, fibre, ca, fe, zn)
         )
-        foods_count += 1
 
         if (i + 1) % 100 == 0:
             conn.commit()
-            print(f"  ... {i+1} / {len(merged)} foods")
+            print(f"  ... {i+1} / {len(merged)} foods written to kfct_* tables")
+
+    # foods rows don't depend on generated ids, so insert them in one batch
+    cur.executemany(
+        """INSERT INTO foods
+           (food_code, food_name_english, food_name_swahili, category, display_name,
+            energy_kcal, protein_g, fat_g, carbs_g, fibre_g, calcium_mg, iron_mg, zinc_mg)
+           VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        foods_rows,
+    )
+    foods_count = len(foods_rows)
+    print(f"  ... {foods_count} foods written to foods table")
 
     conn.commit()
     return kfct_count, foods_count